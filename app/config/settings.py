@@ -1,13 +1,48 @@
+import logging
 import os
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import ClassVar, Dict, Mapping, Optional
+
+from pydantic_settings import BaseSettings, EnvSettingsSource, PydanticBaseSettingsSource, SettingsConfigDict
 
 from app.utils.logger import logger
 
 from app.models.schemas import AppConfig, Settings, DatabaseConfig, CacheConfig, AIConfig, LLMConfig, LLMProvider
 
 
+# Project paths, resolved once at import
+_BASE_DIR = Path(__file__).resolve().parents[2]
+_LOG_DIR = _BASE_DIR / "app" / "logs"
+
+# Snapshot of the process environment, taken once so settings construction
+# reads a plain dict instead of probing os.environ per field
+_ENV_SNAPSHOT: Dict[str, str] = dict(os.environ)
+
+# LLM providers with flat `<prefix>_*` fields on AppSettings, paired with a
+# getter for (api_key, model, temperature, max_tokens)
+_PROVIDERS = tuple(
+    (provider, attrgetter(
+        f"{prefix}_api_key", f"{prefix}_model", f"{prefix}_temperature", f"{prefix}_max_tokens"
+    ))
+    for provider, prefix in (
+        (LLMProvider.GROQ, "groq"),
+        (LLMProvider.OPENAI, "openai"),
+        (LLMProvider.ANTHROPIC, "anthropic"),
+    )
+)
+
+
+class SnapshotEnvSettingsSource(EnvSettingsSource):
+    """Environment settings source backed by the import-time environment snapshot"""
+
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        if self.case_sensitive:
+            return _ENV_SNAPSHOT
+        return {k.lower(): v for k, v in _ENV_SNAPSHOT.items()}
+
+
 class AppSettings(BaseSettings):
     """
     Application settings with structured configuration
@@ -20,6 +55,7 @@ class AppSettings(BaseSettings):
     host: str = "0.0.0.0"
     reload: bool = True
     port: int = 8000
+    workers: Optional[int] = None  # run.py worker processes; defaults to the CPU count
 
     # Security
     secret_key: str  # required, loaded from .env/.env.local
@@ -65,14 +101,15 @@ class AppSettings(BaseSettings):
     cache_max_size: int = 1000     # maximum cache size
 
     # Data Directory
-    base_dir: Path = Path(__file__).resolve().parent.parent.parent
-    data_dir: Path = Path(os.getenv("DATA_DIR", base_dir / "data"))
+    base_dir: ClassVar[Path] = _BASE_DIR
+    # DATA_DIR reaches this field through the env and .env sources
+    data_dir: Path = _BASE_DIR / "data"
 
     # CORS
     cors_origins: list[str] = ["*"]
 
     # Logging Configuration
-    log_dir: Path = Path(__file__).parent.parent / "logs"
+    log_dir: Path = _LOG_DIR
     log_level: str = "DEBUG"   # could be "INFO" / "WARNING" / "ERROR"
     log_complete_file: str = "complete.log"
     log_session_prefix: str = "session"
@@ -85,16 +122,36 @@ class AppSettings(BaseSettings):
         extra="ignore"
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Read environment variables from the snapshot instead of os.environ"""
+        return (
+            init_settings,
+            SnapshotEnvSettingsSource(settings_cls),
+            dotenv_settings,
+            file_secret_settings,
+        )
 
-    def print_settings_summary(self):
-        logger.info("Application Settings Summary:")
-        for key, value in self.model_dump().items():
-            logger.info(f"{key}: {value}")
 
+    @cached_property
+    def available_providers(self) -> frozenset[LLMProvider]:
+        """LLM providers that have an API key configured"""
+        return frozenset(
+            provider for provider, get_fields in _PROVIDERS if get_fields(self)[0]
+        )
 
-    def get_app_config(self) -> AppConfig:
+
+    @cached_property
+    def app_config(self) -> AppConfig:
         """Get application configuration"""
-        return AppConfig(
+        return AppConfig.model_construct(
             name=self.app_name,
             version=self.app_version,
             debug=self.debug,
@@ -103,98 +160,112 @@ class AppSettings(BaseSettings):
         )
 
 
-    def get_database_config(self) -> DatabaseConfig:
+    @cached_property
+    def database_config(self) -> DatabaseConfig:
         """Get database configuration"""
-        return DatabaseConfig(
+        # Leave url out when DB_URL is unset so the schema default applies;
+        # model_construct would otherwise store None without complaint
+        if self.db_url is None:
+            return DatabaseConfig.model_construct()
+        return DatabaseConfig.model_construct(
             url=self.db_url
         )
 
 
-    def get_cache_config(self) -> CacheConfig:
+    @cached_property
+    def cache_config(self) -> CacheConfig:
         """Get cache configuration"""
-        return CacheConfig(
+        return CacheConfig.model_construct(
             enabled=self.cache_enabled,
             ttl=self.cache_ttl,
             max_size=self.cache_max_size
         )
 
 
-    def get_ai_config(self) -> AIConfig:
+    @cached_property
+    def ai_config(self) -> AIConfig:
         """Get AI configuration with provider settings"""
-        providers = {}
-
-        # Configure Groq provider
-        if self.groq_api_key:
-            providers[LLMProvider.GROQ] = LLMConfig(
-                provider=LLMProvider.GROQ,
-                api_key=self.groq_api_key,
-                model=self.groq_model,
-                temperature=self.groq_temperature,
-                max_tokens=self.groq_max_tokens
-            )
-
-        # Configure OpenAI provider
-        if self.openai_api_key:
-            providers[LLMProvider.OPENAI] = LLMConfig(
-                provider=LLMProvider.OPENAI,
-                api_key=self.openai_api_key,
-                model=self.openai_model,
-                temperature=self.openai_temperature,
-                max_tokens=self.openai_max_tokens
-            )
-
-        # Configure Anthropic provider
-        if self.anthropic_api_key:
-            providers[LLMProvider.ANTHROPIC] = LLMConfig(
-                provider=LLMProvider.ANTHROPIC,
-                api_key=self.anthropic_api_key,
-                model=self.anthropic_model,
-                temperature=self.anthropic_temperature,
-                max_tokens=self.anthropic_max_tokens
-            )
-
-        return AIConfig(
+        provider_names = []
+        provider_configs = []
+
+        for provider, get_fields in _PROVIDERS:
+            api_key, model, temperature, max_tokens = get_fields(self)
+            if not api_key:
+                continue
+
+            provider_names.append(provider.value)
+            provider_configs.append(LLMConfig.model_construct(
+                provider=provider,
+                api_key=api_key,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens
+            ))
+
+        return AIConfig.model_construct(
             primary_provider=self.primary_llm_provider,
-            providers=providers,
+            provider_names=tuple(provider_names),
+            provider_configs=tuple(provider_configs),
             enable_caching=self.ai_cache_enabled,
             cache_ttl=self.ai_cache_ttl,
             max_retries=self.ai_max_retries,
             timeout=self.ai_timeout
         )
 
+    @cached_property
+    def structured_settings(self) -> Settings:
+        """Structured settings object, built once per instance"""
+        return Settings.model_construct(
+            app=self.app_config,
+            database=self.database_config,
+            cache=self.cache_config,
+            ai=self.ai_config
+        )
+
     def get_structured_settings(self) -> Settings:
         """Get structured settings object"""
-        return Settings(
-            app=self.get_app_config(),
-            database=self.get_database_config(),
-            cache=self.get_cache_config(),
-            ai=self.get_ai_config()
-        )
+        return self.structured_settings
+
+
+
+
+@lru_cache
+def get_app_settings() -> AppSettings:
+    """Get the application settings, loading and validating them on first use"""
+    app_settings = AppSettings()
 
+    if not validate_settings(app_settings):
+        logger.info("Warning: Some settings are not properly configured!")
+        print_settings_summary(app_settings)
 
+    return app_settings
 
 
-# Create global settings instance
-app_settings = AppSettings()
+@lru_cache
+def get_settings() -> Settings:
+    """Get the structured settings, building them on first use"""
+    return get_app_settings().get_structured_settings()
 
-# Create structured settings for use throughout the app
-settings = app_settings.get_structured_settings()
+
+def __getattr__(name: str):
+    # Load `app_settings` and `settings` lazily on first access (PEP 562)
+    if name == "app_settings":
+        return get_app_settings()
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def validate_settings() -> bool:
+def validate_settings(app_settings: AppSettings) -> bool:
     """Validate that all required settings are properly configured"""
     errors = []
 
     # Check if at least one LLM provider is configured
-    if not any([
-        app_settings.groq_api_key,
-        app_settings.openai_api_key,
-        app_settings.anthropic_api_key
-    ]):
+    if not app_settings.available_providers:
         errors.append("No LLM provider API keys configured")
 
     # Check data directory exists
@@ -210,33 +281,23 @@ def validate_settings() -> bool:
     return True
 
 
-def print_settings_summary():
+def print_settings_summary(app_settings: AppSettings):
     """logger.info a summary of current settings"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info("=== Application Settings Summary ===")
-    logger.info(f"App Name: {app_settings.app_name}")
-    logger.info(f"Version: {app_settings.app_version}")
-    logger.info(f"Debug Mode: {app_settings.debug}")
-    logger.info(f"Host: {app_settings.host}:{app_settings.port}")
-    logger.info(f"Data Directory: {app_settings.data_dir}")
+    logger.info("App Name: %s", app_settings.app_name)
+    logger.info("Version: %s", app_settings.app_version)
+    logger.info("Debug Mode: %s", app_settings.debug)
+    logger.info("Host: %s:%s", app_settings.host, app_settings.port)
+    logger.info("Data Directory: %s", app_settings.data_dir)
 
     logger.info("\n=== AI Configuration ===")
-    logger.info(f"Primary Provider: {app_settings.primary_llm_provider.value}")
-    logger.info(f"Cache Enabled: {app_settings.ai_cache_enabled}")
-
-    providers = []
-    if app_settings.groq_api_key:
-        providers.append("Groq")
-    if app_settings.openai_api_key:
-        providers.append("OpenAI")
-    if app_settings.anthropic_api_key:
-        providers.append("Anthropic")
-
-    logger.info(f"Available Providers: {', '.join(providers) if providers else 'None'}")
-    logger.info("=" * 40)
+    logger.info("Primary Provider: %s", app_settings.primary_llm_provider.value)
+    logger.info("Cache Enabled: %s", app_settings.ai_cache_enabled)
 
+    providers = sorted(provider.value for provider in app_settings.available_providers)
 
-# Validate settings on import
-if not validate_settings():
-    logger.info("Warning: Some settings are not properly configured!")
-    print_settings_summary()
-
+    logger.info("Available Providers: %s", ", ".join(providers) if providers else "None")
+    logger.info("=" * 40)
@@ -1,18 +1,37 @@
-from fastapi import FastAPI
+import asyncio
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
 
 from app.utils.logger import logger
-from app.config.settings import app_settings
+from app.config.settings import get_app_settings
 from app.middleware.custom import LoggingMiddleware
 from app.routes import main_routes, ai_routes, data_routes
 
 logger.info("Logger initialized")
 
+app_settings = get_app_settings()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Application startup")
+
+    # Warm the data cache so the first requests don't pay for disk reads
+    from app.services import data_service, health_service
+    await data_service.warm()
+
+    # Health checks read a snapshot refreshed in the background
+    refresh_task = asyncio.create_task(health_service.run_refresh_loop())
+
     yield
+
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
+    health_service.shutdown()
     logger.debug("Application shutdown")
 
 # Create FastAPI app
@@ -20,7 +39,8 @@ app = FastAPI(
     title=app_settings.app_name,
     version=app_settings.app_version,
     debug=app_settings.debug,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add middleware
@@ -38,28 +58,40 @@ app.include_router(main_routes.router, prefix="/api/v1", tags=["main"])
 app.include_router(ai_routes.router, prefix="/api/v1/ai", tags=["ai"])
 app.include_router(data_routes.router, prefix="/api/v1/data", tags=["data"])
 
+# Static payloads, serialized once since they never change while running
+_ROOT_BYTES = orjson.dumps({
+    "message": "Welcome to Resume Backend API",
+    "version": app_settings.app_version,
+    "status": "running"
+})
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "version": app_settings.app_version
+})
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to Resume Backend API",
-        "version": app_settings.app_version,
-        "status": "running"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "version": app_settings.app_version
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
+
+    from app.utils.server import uvicorn_backends
+
+    loop, http = uvicorn_backends()
+
     uvicorn.run(
         "app.main:app",
         host=app_settings.host,
         port=app_settings.port,
-        reload=app_settings.reload
+        reload=app_settings.reload,
+        loop=loop,
+        http=http,
+        log_level="info"
     )
@@ -1,5 +1,6 @@
 from app.utils.logger import logger
 
+import logging
 import time
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -10,19 +11,27 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     """Custom logging middleware to log all requests"""
 
     async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+        # Skip all timing and formatting work when INFO is not logged
+        if not logger.isEnabledFor(logging.INFO):
+            return await call_next(request)
 
-        # Log request
-        logger.info(f"Request: {request.method} {request.url}")
+        start_time = time.perf_counter_ns()
+
+        # Log request, from the raw scope rather than rebuilding the full URL
+        scope = request.scope
+        if scope["query_string"] and logger.isEnabledFor(logging.DEBUG):
+            logger.info("Request: %s %s?%s", scope["method"], scope["path"], scope["query_string"].decode("latin-1"))
+        else:
+            logger.info("Request: %s %s", scope["method"], scope["path"])
 
         # Process request
         response = await call_next(request)
 
         # Calculate processing time
-        process_time = time.time() - start_time
+        process_ms = (time.perf_counter_ns() - start_time) / 1e6
 
         # Log response
-        logger.info(".2f")
+        logger.info("Response: %s response_ms=%.2f", response.status_code, process_ms)
 
         return response
 
@@ -33,6 +42,12 @@ class CORSMiddleware:
     def __init__(self, app, allow_origins: list = None):
         self.app = app
         self.allow_origins = allow_origins or ["*"]
+        # Encoded once and shared by every response
+        self._cors_headers = (
+            (b"access-control-allow-origin", b"*"),
+            (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"),
+            (b"access-control-allow-headers", b"*"),
+        )
 
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
@@ -41,10 +56,7 @@ class CORSMiddleware:
 
         async def add_cors_headers(message):
             if message["type"] == "http.response.start":
-                headers = message.get("headers", [])
-                headers.append([b"access-control-allow-origin", b"*"])
-                headers.append([b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"])
-                headers.append([b"access-control-allow-headers", b"*"])
+                message.setdefault("headers", []).extend(self._cors_headers)
             await send(message)
 
         await self.app(scope, receive, add_cors_headers)
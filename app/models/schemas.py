@@ -1,7 +1,13 @@
-from pydantic import BaseModel, Field, RootModel
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
-from enum import Enum
+from pydantic import BaseModel, Field, PrivateAttr, RootModel
+from typing import List, Dict, Any, Optional, Tuple, Union
+from datetime import datetime, timezone
+from enum import Enum, StrEnum
+
+
+def _now(_tz=timezone.utc) -> datetime:
+    """Current UTC time; replaces the deprecated datetime.utcnow"""
+    return datetime.now(_tz)
+
 
 # ============================================================================
 # BASE MODELS & COMMON SCHEMAS
@@ -12,7 +18,7 @@ class APIResponse(BaseModel):
     success: bool = True
     message: Optional[str] = None
     data: Optional[Union[Dict[str, Any], List[Any]]] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now)
     meta: Optional[Dict[str, Any]] = None
 
 
@@ -179,7 +185,7 @@ class CertificationData(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now)
     version: str
     uptime: Optional[float] = None
 
@@ -189,7 +195,7 @@ class AIStatusResponse(BaseModel):
     status: str
     components: Dict[str, str]
     providers: Dict[str, bool]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now)
 
 # ============================================================================
 # ERROR MODELS
@@ -208,7 +214,7 @@ class ErrorResponse(BaseModel):
     error: str
     error_code: str
     details: Optional[List[ErrorDetail]] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now)
     request_id: Optional[str] = None
 
 # ============================================================================
@@ -237,7 +243,7 @@ class PaginatedCertificatesResponse(BaseModel):
 # ============================================================================
 
 # ---------- Provider ----------
-class LLMProvider(str, Enum):
+class LLMProvider(StrEnum):
     GROQ = "groq"
     OPENAI = "openai"
     ANTHROPIC = "anthropic"
@@ -332,12 +338,25 @@ class CacheConfig(BaseModel):
 
 class AIConfig(BaseModel):
     primary_provider: LLMProvider = LLMProvider.OPENAI
-    providers: Dict[LLMProvider, LLMConfig]
+    # Parallel tuples: provider_configs[i] is the config for provider_names[i]
+    provider_names: Tuple[str, ...] = ()
+    provider_configs: Tuple[LLMConfig, ...] = ()
     enable_caching: bool = True
     cache_ttl: int = 3600
     max_retries: int = 3
     timeout: int = 30
 
+    _index: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Runs for model_construct() too, unlike validators
+        self._index = {name: i for i, name in enumerate(self.provider_names)}
+
+    def get_provider(self, name: str) -> Optional[LLMConfig]:
+        """Get the config for a provider, or None if it is not configured"""
+        index = self._index.get(name)
+        return None if index is None else self.provider_configs[index]
+
 
 class Settings(BaseModel):
     app: AppConfig
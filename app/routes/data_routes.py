@@ -1,63 +1,74 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from app.models.schemas import (
     PortfolioProfile, ExperienceList, ProjectList,
-    CertificationData, APIResponse, FilterOptions,
+    CertificationData, FilterOptions,
     PaginatedProjectsResponse, PaginatedJobsResponse,
     PaginatedCertificatesResponse
 )
 from app.services import data_service
+from app.services.data_service import CachedResponse
 from app.utils.logger import logger
+from app.utils.responses import success_response
 
 router = APIRouter()
 
-@router.get("/profile", response_model=APIResponse)
-async def get_profile():
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of If-None-Match against our ETag (RFC 9110, section 13.1.2)"""
+    if not if_none_match:
+        return False
+
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _cached_json_response(request: Request, cached: CachedResponse) -> Response:
+    """Send a pre-serialized envelope, or 304 if the client already has it"""
+    headers = {"ETag": cached.etag, "Cache-Control": "public, max-age=60"}
+
+    if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+@router.get("/profile", response_class=ORJSONResponse)
+async def get_profile(request: Request):
     """Get portfolio profile information"""
-    data = data_service.get_profile_data()
-    if data is None:
+    cached = await data_service.get_profile_response_async()
+    if cached is None:
         raise HTTPException(status_code=404, detail="Profile data not found")
 
-    return APIResponse(
-        success=True,
-        message="Profile retrieved successfully",
-        data=data
-    )
+    return _cached_json_response(request, cached)
 
-@router.get("/intro", response_model=APIResponse)
-async def get_intro():
+@router.get("/intro", response_class=ORJSONResponse)
+async def get_intro(request: Request):
     """Get introduction information"""
-    data = data_service.get_intro_data()
-    if data is None:
+    cached = await data_service.get_intro_response_async()
+    if cached is None:
         raise HTTPException(status_code=404, detail="Intro data not found")
 
-    return APIResponse(
-        success=True,
-        message="Introduction retrieved successfully",
-        data=data
-    )
+    return _cached_json_response(request, cached)
 
-@router.get("/layout", response_model=APIResponse)
-async def get_layout():
+@router.get("/layout", response_class=ORJSONResponse)
+async def get_layout(request: Request):
     """Get layout configuration"""
-    data = data_service.get_layout_data()
-    if data is None:
+    cached = await data_service.get_layout_response_async()
+    if cached is None:
         raise HTTPException(status_code=404, detail="Layout data not found")
 
-    return APIResponse(
-        success=True,
-        message="Layout retrieved successfully",
-        data=data
-    )
+    return _cached_json_response(request, cached)
 
-@router.get("/projects", response_model=APIResponse)
+@router.get("/projects", response_class=ORJSONResponse)
 async def get_projects(
     category: Optional[str] = Query(None, description="Filter by category"),
     featured: Optional[bool] = Query(None, description="Filter featured projects"),
     limit: int = Query(50, description="Limit number of results")
 ):
     """Get projects data with optional filtering"""
-    projects = data_service.get_projects_data(
+    projects = await data_service.get_projects_data_async(
         category=category,
         featured=featured,
         limit=limit
@@ -66,48 +77,32 @@ async def get_projects(
     if projects is None:
         raise HTTPException(status_code=404, detail="Projects data not found")
 
-    return APIResponse(
-        success=True,
-        message=f"Retrieved {len(projects)} projects",
-        data=projects
-    )
+    return success_response(f"Retrieved {len(projects)} projects", projects)
 
-@router.get("/experience", response_model=APIResponse)
+@router.get("/experience", response_class=ORJSONResponse)
 async def get_experience():
     """Get work experience data"""
-    data = data_service.get_experience_data()
+    data = await data_service.get_experience_data_async()
     if data is None:
         raise HTTPException(status_code=404, detail="Experience data not found")
 
-    return APIResponse(
-        success=True,
-        message="Experience data retrieved successfully",
-        data=data
-    )
+    return success_response("Experience data retrieved successfully", data)
 
-@router.get("/certificates", response_model=APIResponse)
+@router.get("/certificates", response_class=ORJSONResponse)
 async def get_certificates():
     """Get certificates data"""
-    data = data_service.get_certificates_data()
+    data = await data_service.get_certificates_data_async()
     if data is None:
         raise HTTPException(status_code=404, detail="Certificates data not found")
 
-    return APIResponse(
-        success=True,
-        message="Certificates retrieved successfully",
-        data=data
-    )
+    return success_response("Certificates retrieved successfully", data)
 
-@router.get("/projects/{project_id}", response_model=APIResponse)
+@router.get("/projects/{project_id}", response_class=ORJSONResponse)
 async def get_project_by_id(project_id: str):
     """Get specific project by ID"""
-    project = data_service.get_project_by_id(project_id)
+    project = await data_service.get_project_by_id_async(project_id)
 
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    return APIResponse(
-        success=True,
-        message="Project retrieved successfully",
-        data=project
-    )
\ No newline at end of file
+    return success_response("Project retrieved successfully", project)
\ No newline at end of file
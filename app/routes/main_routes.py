@@ -1,14 +1,17 @@
-from fastapi import APIRouter, HTTPException
-from app.models.schemas import HealthResponse, APIResponse
+from fastapi import APIRouter, HTTPException, Response
+from app.models.schemas import HealthResponse
 from app.services import health_service
 from app.utils.logger import logger
+from app.utils.responses import success_response
 
 router = APIRouter()
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(response: Response):
     """Health check endpoint"""
-    health_data = health_service.get_health_status()
+    health_data = await health_service.get_health_status_async()
+    # Matches the service-side TTL, so pollers can reuse the last answer
+    response.headers["Cache-Control"] = "max-age=5"
 
     return HealthResponse(
         status=health_data.get("status", "unknown"),
@@ -20,21 +23,13 @@ async def health_check():
 @router.get("/status")
 async def get_status():
     """Get application status"""
-    status_data = health_service.get_system_status()
+    status_data = await health_service.get_system_status_async()
 
-    return APIResponse(
-        success=True,
-        message="Application is running",
-        data=status_data
-    )
+    return success_response("Application is running", status_data)
 
 @router.get("/config")
 async def get_config():
     """Get application configuration (without sensitive data)"""
-    config_data = health_service.get_config_status()
+    config_data = await health_service.get_config_status_async()
 
-    return APIResponse(
-        success=True,
-        message="Configuration retrieved",
-        data=config_data
-    )
\ No newline at end of file
+    return success_response("Configuration retrieved", config_data)
\ No newline at end of file
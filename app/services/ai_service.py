@@ -4,22 +4,119 @@ AI Service Module
 Handles AI-related operations including chat, classification, and provider management.
 """
 
+import re
 import time
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 from app.config.settings import app_settings
 from app.models.schemas import (
     LLMProvider, LLMRequest, LLMResponse, MessageClassification,
-    AIStatusResponse, ProviderInfo
+    MessageType, AIStatusResponse, ProviderInfo
 )
+from app.utils.cache import TTLCache
 from app.utils.logger import logger
 
 
+# Keyword tables for the classifiers, in priority order
+_MESSAGE_TYPE_KEYWORDS = (
+    (MessageType.QUESTION, ("what", "how", "tell me", "explain")),
+    (MessageType.COMMAND, ("do", "create", "build", "make")),
+    (MessageType.SEARCH, ("find", "search", "look for")),
+)
+_INTENT_KEYWORDS = (
+    ("project_inquiry", ("project",)),
+    ("experience_inquiry", ("experience", "work")),
+    ("certificate_inquiry", ("certificate",)),
+    ("skill_inquiry", ("skill",)),
+    ("contact_inquiry", ("contact",)),
+)
+_TECHNOLOGIES = ("python", "react", "javascript", "machine learning", "data science")
+
+# Canned chat replies, picked by the first keyword group found in the message
+_MOCK_RESPONSES = (
+    (("project",), "I'd be happy to tell you about my projects! I have several interesting projects in data science, machine learning, and web development. You can check out my portfolio for more details."),
+    (("experience", "work"), "I have experience in software development, data analysis, and machine learning. I've worked on various projects involving Python, React, and cloud technologies."),
+    (("certificate", "certification"), "I hold several certifications in data science, machine learning, and software development. These include certifications from Google, AWS, and various online learning platforms."),
+    (("contact", "email"), "You can reach out to me through the contact form on my website, or find my contact information in the portfolio."),
+)
+_DEFAULT_MOCK_RESPONSE = "Hello! I'm here to help you learn more about my portfolio, projects, experience, and skills. Feel free to ask me anything specific!"
+
+# Upper bound on distinct chat messages kept in the response cache, and how
+# many seconds a cached reply is served before it is rebuilt
+_CHAT_CACHE_SIZE = 1024
+_CHAT_CACHE_TTL = 300
+
+_KEYWORDS = frozenset(
+    [word for _, words in _MESSAGE_TYPE_KEYWORDS for word in words]
+    + [word for _, words in _INTENT_KEYWORDS for word in words]
+    + list(_TECHNOLOGIES)
+    + [word for words, _ in _MOCK_RESPONSES for word in words]
+)
+
+# One pattern for all keywords. The lookahead makes finditer try every
+# position, so overlapping keywords are found in a single scan; longest
+# alternatives go first, and any keyword that is a prefix of the one that
+# matched is credited through _KEYWORD_PREFIXES. Like the old `in` checks,
+# matches are plain substrings, not whole words.
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(word) for word in sorted(_KEYWORDS, key=len, reverse=True)) + "))"
+)
+_KEYWORD_PREFIXES = {
+    word: frozenset(other for other in _KEYWORDS if word.startswith(other))
+    for word in _KEYWORDS
+}
+
+
+@lru_cache(maxsize=4096)
+def _match_keywords(message_lower: str) -> frozenset:
+    """Find every classifier keyword in the lowercased message in one pass"""
+    found = set()
+    for match in _KEYWORD_PATTERN.finditer(message_lower):
+        found |= _KEYWORD_PREFIXES[match.group(1)]
+    return frozenset(found)
+
+
+def _classify_message_type(message_lower: str) -> MessageType:
+    """Classify the type of message"""
+    found = _match_keywords(message_lower)
+    for message_type, words in _MESSAGE_TYPE_KEYWORDS:
+        if not found.isdisjoint(words):
+            return message_type
+    return MessageType.CONVERSATION
+
+
+def _extract_intent(message_lower: str) -> str:
+    """Extract the intent from the message"""
+    found = _match_keywords(message_lower)
+    for intent, words in _INTENT_KEYWORDS:
+        if not found.isdisjoint(words):
+            return intent
+    return "general_inquiry"
+
+
+def _extract_technologies(message_lower: str) -> Tuple[str, ...]:
+    """Extract technology mentions from the message"""
+    # Simple keyword matching - in a real implementation,
+    # you would use NLP libraries like spaCy
+    found = _match_keywords(message_lower)
+    return tuple(tech for tech in _TECHNOLOGIES if tech in found)
+
+
 class AIService:
     """Service for AI operations and provider management"""
 
     def __init__(self):
         self.providers = self._initialize_providers()
+        # ProviderInfo models are immutable in practice, so build each once
+        self._provider_info: Dict[LLMProvider, ProviderInfo] = {
+            provider: self._build_provider_info(provider) for provider in self.providers
+        }
+        # Identical prompts get the same reply, so serve repeats from memory
+        self._chat_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=_CHAT_CACHE_SIZE, ttl=_CHAT_CACHE_TTL)
+            if app_settings.ai_cache_enabled else None
+        )
 
     def _initialize_providers(self) -> Dict[LLMProvider, Any]:
         """Initialize available AI providers"""
@@ -29,87 +126,89 @@ class AIService:
         # In a real implementation, you would initialize actual client libraries
         # like OpenAI, Anthropic, Groq, etc.
 
-        if app_settings.groq_api_key:
-            providers[LLMProvider.GROQ] = {
-                "api_key": app_settings.groq_api_key,
-                "model": app_settings.groq_model,
-                "base_url": None
-            }
-
-        if app_settings.openai_api_key:
-            providers[LLMProvider.OPENAI] = {
-                "api_key": app_settings.openai_api_key,
-                "model": app_settings.openai_model,
-                "base_url": None
-            }
-
-        if app_settings.anthropic_api_key:
-            providers[LLMProvider.ANTHROPIC] = {
-                "api_key": app_settings.anthropic_api_key,
-                "model": app_settings.anthropic_model,
-                "base_url": None
-            }
+        ai_config = app_settings.ai_config
+        for provider in LLMProvider:
+            config = ai_config.get_provider(provider.value)
+            if config is not None:
+                providers[provider] = {
+                    "api_key": config.api_key,
+                    "model": config.model,
+                    "base_url": None
+                }
 
         return providers
 
     def chat_with_ai(self, request: LLMRequest) -> LLMResponse:
         """Process a chat request with AI"""
         try:
-            logger.info(f"Processing AI chat request from user: {request.user_id}")
+            logger.info("Processing AI chat request from user: %s", request.user_id)
+
+            if self._chat_cache is not None:
+                cached = self._chat_cache.get(request.message)
+                if cached is not None:
+                    return cached
 
             # For now, return a mock response
             # In a real implementation, you would call the actual AI provider
 
             provider_info = self._get_provider_info(app_settings.primary_llm_provider)
 
-            return LLMResponse(
+            response = LLMResponse(
                 content_type="text",
-                content=self._get_mock_response(request.message),
+                content=self._get_mock_response(request.message.lower()),
                 confidence=0.85,
                 provider_info=provider_info,
                 processing_time=0.15
             )
 
+            if self._chat_cache is not None:
+                self._chat_cache.set(request.message, response)
+
+            return response
+
         except Exception as e:
-            logger.error(f"Error in AI chat service: {str(e)}")
+            logger.error("Error in AI chat service: %s", e)
             raise
 
     def classify_message(self, request: LLMRequest) -> MessageClassification:
         """Classify a user message"""
         try:
-            logger.info(f"Classifying message: {request.message[:50]}...")
+            logger.info("Classifying message: %.50s...", request.message)
 
             # Mock classification logic
             # In a real implementation, you would use AI to classify the message
 
-            message_type = self._classify_message_type(request.message)
-            intent = self._extract_intent(request.message)
+            message_lower = request.message.lower()
+            message_type = _classify_message_type(message_lower)
+            intent = _extract_intent(message_lower)
+
+            # Build a fresh dict so the cached tuple is never shared mutably
+            entities = {}
+            technologies = _extract_technologies(message_lower)
+            if technologies:
+                entities["technologies"] = list(technologies)
 
             return MessageClassification(
                 type=message_type,
                 intent=intent,
                 confidence=0.78,
-                entities=self._extract_entities(request.message)
+                entities=entities
             )
 
         except Exception as e:
-            logger.error(f"Error in message classification: {str(e)}")
+            logger.error("Error in message classification: %s", e)
             raise
 
     def get_ai_status(self) -> AIStatusResponse:
         """Get the current status of AI services"""
         try:
             # Check provider availability
-            provider_status = {}
+            provider_status = {provider.value: True for provider in app_settings.available_providers}
             components_status = {
                 "llm_service": "operational",
                 "cache": "operational" if app_settings.cache_enabled else "disabled"
             }
 
-            for provider, config in self.providers.items():
-                # In a real implementation, you would check actual connectivity
-                provider_status[provider.value] = True
-
             # Determine overall status
             has_providers = len(provider_status) > 0
             status = "operational" if has_providers else "degraded"
@@ -121,11 +220,18 @@ class AIService:
             )
 
         except Exception as e:
-            logger.error(f"Error getting AI status: {str(e)}")
+            logger.error("Error getting AI status: %s", e)
             raise
 
     def _get_provider_info(self, provider: LLMProvider) -> ProviderInfo:
         """Get provider information for response"""
+        info = self._provider_info.get(provider)
+        if info is None:
+            info = self._provider_info[provider] = self._build_provider_info(provider)
+        return info
+
+    def _build_provider_info(self, provider: LLMProvider) -> ProviderInfo:
+        """Build provider information for a provider"""
         if provider in self.providers:
             config = self.providers[provider]
             return ProviderInfo(
@@ -145,69 +251,14 @@ class AIService:
                 cost_estimate=0.0
             )
 
-    def _get_mock_response(self, message: str) -> str:
-        """Generate a mock AI response based on the input message"""
+    def _get_mock_response(self, message_lower: str) -> str:
+        """Generate a mock AI response based on the lowercased input message"""
         # Simple keyword-based response generation
-        message_lower = message.lower()
-
-        if "project" in message_lower:
-            return "I'd be happy to tell you about my projects! I have several interesting projects in data science, machine learning, and web development. You can check out my portfolio for more details."
-        elif "experience" in message_lower or "work" in message_lower:
-            return "I have experience in software development, data analysis, and machine learning. I've worked on various projects involving Python, React, and cloud technologies."
-        elif "certificate" in message_lower or "certification" in message_lower:
-            return "I hold several certifications in data science, machine learning, and software development. These include certifications from Google, AWS, and various online learning platforms."
-        elif "contact" in message_lower or "email" in message_lower:
-            return "You can reach out to me through the contact form on my website, or find my contact information in the portfolio."
-        else:
-            return "Hello! I'm here to help you learn more about my portfolio, projects, experience, and skills. Feel free to ask me anything specific!"
-
-    def _classify_message_type(self, message: str) -> str:
-        """Classify the type of message"""
-        from app.models.schemas import MessageType
-
-        message_lower = message.lower()
-
-        if any(word in message_lower for word in ["what", "how", "tell me", "explain"]):
-            return MessageType.QUESTION
-        elif any(word in message_lower for word in ["do", "create", "build", "make"]):
-            return MessageType.COMMAND
-        elif any(word in message_lower for word in ["find", "search", "look for"]):
-            return MessageType.SEARCH
-        else:
-            return MessageType.CONVERSATION
-
-    def _extract_intent(self, message: str) -> str:
-        """Extract the intent from the message"""
-        message_lower = message.lower()
-
-        if "project" in message_lower:
-            return "project_inquiry"
-        elif "experience" in message_lower or "work" in message_lower:
-            return "experience_inquiry"
-        elif "certificate" in message_lower:
-            return "certificate_inquiry"
-        elif "skill" in message_lower:
-            return "skill_inquiry"
-        elif "contact" in message_lower:
-            return "contact_inquiry"
-        else:
-            return "general_inquiry"
-
-    def _extract_entities(self, message: str) -> Dict[str, Any]:
-        """Extract entities from the message"""
-        # Simple entity extraction - in a real implementation,
-        # you would use NLP libraries like spaCy
-        entities = {}
-
-        message_lower = message.lower()
-
-        # Extract technology mentions
-        technologies = ["python", "react", "javascript", "machine learning", "data science"]
-        mentioned_tech = [tech for tech in technologies if tech in message_lower]
-        if mentioned_tech:
-            entities["technologies"] = mentioned_tech
-
-        return entities
+        found = _match_keywords(message_lower)
+        for words, response in _MOCK_RESPONSES:
+            if not found.isdisjoint(words):
+                return response
+        return _DEFAULT_MOCK_RESPONSE
 
 
 # Create global AI service instance
@@ -4,65 +4,209 @@ Data Service Module
 Handles data loading and retrieval operations for portfolio data.
 """
 
-import json
+import asyncio
+import hashlib
+import mmap
 import os
-from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from pathlib import Path
 
+import orjson
+
 from app.config.settings import app_settings
 from app.utils.logger import logger
 
 
+# Every data file served by the API, loaded up front by DataService.warm()
+DATA_FILES = (
+    "page.json",
+    "intro.json",
+    "layout.json",
+    "projects.json",
+    "jobs.json",
+    "certificates.json",
+)
+
+
+# Envelope message for each file served as a pre-serialized response
+RESPONSE_MESSAGES = {
+    "page.json": "Profile retrieved successfully",
+    "intro.json": "Introduction retrieved successfully",
+    "layout.json": "Layout retrieved successfully",
+}
+
+
+class CachedResponse(NamedTuple):
+    """A serialized response envelope and its entity tag"""
+    body: bytes
+    etag: str
+
+
+class ProjectIndexes(NamedTuple):
+    """Lookup tables over projects.json, published together as one object"""
+    by_id: Dict[str, Dict[str, Any]]
+    by_category: Dict[str, List[Dict[str, Any]]]  # Lowercased category keys
+    by_featured: Dict[bool, List[Dict[str, Any]]]
+
+
+_EMPTY_PROJECT_INDEXES = ProjectIndexes({}, {}, {})
+
+
 class DataService:
     """Service for loading and managing portfolio data"""
 
     def __init__(self):
         self.data_dir = app_settings.data_dir
-        self._cache = {}  # Simple in-memory cache
+        self._cache: Dict[str, Tuple[int, Any]] = {}  # filename -> (mtime_ns, data)
+        # filename -> (data the envelope was built from, envelope)
+        self._response_cache: Dict[str, Tuple[Any, CachedResponse]] = {}
+        self._project_indexes = _EMPTY_PROJECT_INDEXES
+        self.stats_revision = 0  # Bumped whenever the loaded data changes
+
+    def _cached(self, filename: str) -> Optional[Any]:
+        """Get loaded data for a file if it is unchanged on disk (a single stat)"""
+        entry = self._cache.get(filename)
+        if entry is None:
+            return None
+
+        try:
+            mtime_ns = (self.data_dir / filename).stat().st_mtime_ns
+        except OSError:
+            return None
+
+        return entry[1] if entry[0] == mtime_ns else None
 
     def _load_json_file(self, filename: str) -> Optional[Any]:
         """Load data from a JSON file with caching"""
-        if filename in self._cache:
-            return self._cache[filename]
+        data = self._cached(filename)
+        if data is not None:
+            return data
+
+        return self._load_from_disk(filename)
+
+    async def _load_json_file_async(self, filename: str) -> Optional[Any]:
+        """Load data from a JSON file with caching, reading it in a worker thread on a miss"""
+        data = self._cached(filename)
+        if data is not None:
+            return data
+
+        return await asyncio.to_thread(self._load_from_disk, filename)
+
+    async def warm(self):
+        """Load every data file into the cache in parallel worker threads"""
+        await asyncio.gather(*(self._load_json_file_async(filename) for filename in DATA_FILES))
+        logger.info("Data cache warmed (%d/%d files)", len(self._cache), len(DATA_FILES))
 
+    def _load_from_disk(self, filename: str) -> Optional[Any]:
+        """Read and parse a JSON file, storing the result in the cache"""
         file_path = self.data_dir / filename
 
         try:
-            if not file_path.exists():
-                logger.error(f"Data file not found: {file_path}")
-                return None
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._cache[filename] = data
-                logger.debug(f"Loaded data from {filename}")
-                return data
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON file {file_path}: {str(e)}")
+            # Parse straight from a read-only mapping: pages fault in from the
+            # page cache on demand and nothing is copied into a Python buffer
+            with open(file_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if st.st_size == 0:
+                    # mmap rejects empty files; let orjson report it as bad JSON
+                    data = orjson.loads(b"")
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        data = orjson.loads(view)
+
+            # Readers may run concurrently in other threads: publish the
+            # complete indexes first, then the data, then drop what is stale
+            if filename == "projects.json":
+                self._project_indexes = self._index_projects(data)
+            self._cache[filename] = (st.st_mtime_ns, data)
+            self._response_cache.pop(filename, None)
+            self.stats_revision += 1
+            logger.debug("Loaded data from %s", filename)
+            return data
+
+        except FileNotFoundError:
+            logger.error("Data file not found: %s", file_path)
+            return None
+        except orjson.JSONDecodeError as e:
+            logger.error("Error parsing JSON file %s: %s", file_path, e)
             return None
         except Exception as e:
-            logger.error(f"Error loading file {file_path}: {str(e)}")
+            logger.error("Error loading file %s: %s", file_path, e)
+            return None
+
+    def _response_for(self, filename: str, data: Optional[Any]) -> Optional[CachedResponse]:
+        """Get the serialized success envelope for loaded data, building it once per load"""
+        if data is None:
             return None
 
+        entry = self._response_cache.get(filename)
+        # The identity check keeps an envelope built from superseded data
+        # (e.g. by a request racing a reload) from being served
+        if entry is not None and entry[0] is data:
+            return entry[1]
+
+        body = orjson.dumps({
+            "success": True,
+            "message": RESPONSE_MESSAGES[filename],
+            "data": data
+        })
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        response = CachedResponse(body, etag)
+        self._response_cache[filename] = (data, response)
+        return response
+
+    @staticmethod
+    def _index_projects(data: Any) -> ProjectIndexes:
+        """Index projects by id, category and featured flag for fast lookups"""
+        if not isinstance(data, list):
+            return _EMPTY_PROJECT_INDEXES
+
+        by_id = {}
+        by_category = defaultdict(list)
+        by_featured = defaultdict(list)
+        for project in data:
+            # Skip malformed entries rather than failing the whole load
+            if not isinstance(project, dict):
+                continue
+
+            project_id = project.get("id")
+            if isinstance(project_id, (str, int)):
+                # Keep the first project for a duplicated id, like a linear scan would
+                by_id.setdefault(project_id, project)
+
+            category = project.get("category")
+            by_category[category.lower() if isinstance(category, str) else ""].append(project)
+            by_featured[bool(project.get("featured", False))].append(project)
+
+        return ProjectIndexes(by_id, dict(by_category), dict(by_featured))
+
     def get_profile_data(self) -> Optional[Dict[str, Any]]:
         """Get portfolio profile data"""
         return self._load_json_file("page.json")
 
+    async def get_profile_response_async(self) -> Optional[CachedResponse]:
+        """Get the serialized profile response, loading it off the event loop on a miss"""
+        return self._response_for("page.json", await self._load_json_file_async("page.json"))
+
     def get_intro_data(self) -> Optional[Dict[str, Any]]:
         """Get introduction data"""
         return self._load_json_file("intro.json")
 
+    async def get_intro_response_async(self) -> Optional[CachedResponse]:
+        """Get the serialized introduction response, loading it off the event loop on a miss"""
+        return self._response_for("intro.json", await self._load_json_file_async("intro.json"))
+
     def get_layout_data(self) -> Optional[Dict[str, Any]]:
         """Get layout configuration"""
         return self._load_json_file("layout.json")
 
-    def get_projects_data(self, category: Optional[str] = None,
-                         featured: Optional[bool] = None,
-                         limit: int = 50) -> Optional[List[Dict[str, Any]]]:
-        """Get projects data with optional filtering"""
-        data = self._load_json_file("projects.json")
+    async def get_layout_response_async(self) -> Optional[CachedResponse]:
+        """Get the serialized layout response, loading it off the event loop on a miss"""
+        return self._response_for("layout.json", await self._load_json_file_async("layout.json"))
 
+    def _filter_projects(self, data: Optional[Any], category: Optional[str],
+                         featured: Optional[bool], limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Filter loaded projects data using the prebuilt indexes"""
         if data is None:
             return None
 
@@ -70,46 +214,70 @@ class DataService:
             logger.error("Projects data is not a list")
             return None
 
-        projects = data
-
-        # Apply filters
+        # Apply filters, starting from the narrowest prebuilt index
+        indexes = self._project_indexes
         if category:
-            projects = [p for p in projects if p.get("category", "").lower() == category.lower()]
+            projects = indexes.by_category.get(category.lower(), [])
+            if featured is not None:
+                projects = [p for p in projects if bool(p.get("featured", False)) == featured]
+        elif featured is not None:
+            projects = indexes.by_featured.get(featured, [])
+        else:
+            projects = data
 
-        if featured is not None:
-            projects = [p for p in projects if p.get("featured", False) == featured]
+        # Apply limit (slicing also keeps the indexes from leaking to callers)
+        return projects[:limit]
 
-        # Apply limit
-        projects = projects[:limit]
+    def get_projects_data(self, category: Optional[str] = None,
+                         featured: Optional[bool] = None,
+                         limit: int = 50) -> Optional[List[Dict[str, Any]]]:
+        """Get projects data with optional filtering"""
+        return self._filter_projects(self._load_json_file("projects.json"), category, featured, limit)
 
-        return projects
+    async def get_projects_data_async(self, category: Optional[str] = None,
+                                      featured: Optional[bool] = None,
+                                      limit: int = 50) -> Optional[List[Dict[str, Any]]]:
+        """Get filtered projects data, loading it off the event loop on a miss"""
+        data = await self._load_json_file_async("projects.json")
+        return self._filter_projects(data, category, featured, limit)
 
     def get_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific project by ID"""
-        data = self._load_json_file("projects.json")
+        # Loading populates the index
+        self._load_json_file("projects.json")
+        return self._project_indexes.by_id.get(project_id)
 
-        if data is None or not isinstance(data, list):
-            return None
-
-        for project in data:
-            if project.get("id") == project_id:
-                return project
-
-        return None
+    async def get_project_by_id_async(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Get a specific project by ID, loading projects off the event loop on a miss"""
+        await self._load_json_file_async("projects.json")
+        return self._project_indexes.by_id.get(project_id)
 
     def get_experience_data(self) -> Optional[List[Dict[str, Any]]]:
         """Get work experience data"""
         data = self._load_json_file("jobs.json")
         return data if isinstance(data, list) else None
 
+    async def get_experience_data_async(self) -> Optional[List[Dict[str, Any]]]:
+        """Get work experience data, loading it off the event loop on a miss"""
+        data = await self._load_json_file_async("jobs.json")
+        return data if isinstance(data, list) else None
+
     def get_certificates_data(self) -> Optional[List[Dict[str, Any]]]:
         """Get certificates data"""
         data = self._load_json_file("certificates.json")
         return data if isinstance(data, list) else None
 
+    async def get_certificates_data_async(self) -> Optional[List[Dict[str, Any]]]:
+        """Get certificates data, loading it off the event loop on a miss"""
+        data = await self._load_json_file_async("certificates.json")
+        return data if isinstance(data, list) else None
+
     def clear_cache(self):
-        """Clear the data cache"""
+        """Clear the data cache; files reload on next access, or all at once via warm()"""
         self._cache.clear()
+        self._response_cache.clear()
+        self._project_indexes = _EMPTY_PROJECT_INDEXES
+        self.stats_revision += 1
         logger.info("Data cache cleared")
 
     def get_data_stats(self) -> Dict[str, Any]:
@@ -4,9 +4,13 @@ Health Service Module
 Handles system health checks, status monitoring, and diagnostics.
 """
 
+import asyncio
 import time
 import os
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Tuple
 
 from app.config.settings import app_settings
 from app.services.data_service import data_service
@@ -20,20 +24,196 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     logger.warning("psutil not available - system monitoring features will be limited")
 
+# Process start reference for uptime; monotonic so clock adjustments don't skew it
+APP_START = time.monotonic()
+
+# Seconds a computed status stays fresh; these values barely move between polls
+HEALTH_TTL = 5.0
+SYSTEM_TTL = 10.0
+CONFIG_TTL = 60.0
+
+# Seconds between background snapshot refreshes; a snapshot older than twice
+# this is treated as missing and the status is computed on demand instead
+REFRESH_INTERVAL = 5.0
+
+# Seconds a data directory existence check is trusted before stat-ing again
+DATA_DIR_CHECK_TTL = 30.0
+
+# Seconds one round of service probes is reused across health and diagnostics
+SERVICES_STATUS_TTL = 5
+
+# Seconds a single service probe may take before its last known status is used
+PROBE_TIMEOUT = 2.0
+
+# Shortest window psutil.cpu_percent() averages over; closer samples are noisy
+CPU_SAMPLE_INTERVAL = 2.0
+
 
 class HealthService:
     """Service for system health monitoring and diagnostics"""
 
     def __init__(self):
-        self.start_time = time.time()
+        # Recently computed statuses: key -> (computed_at, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # One lock per key, so a slow recompute of one status never blocks the others
+        self._cache_locks: Dict[str, threading.Lock] = {}
+
+        # (taken_at, {"health": ..., "diagnostics": ...}), written only by
+        # run_refresh_loop and replaced wholesale so readers never see a partial one
+        self._last_snapshot: Optional[Tuple[float, Dict[str, Any]]] = None
+
+        # API keys are fixed once settings load
+        self._provider_count = len(app_settings.available_providers)
+
+        # Service probes run concurrently; keep each one's last answer for timeouts.
+        # The executor is created on first use and released by shutdown()
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+        self._last_probe_status: Dict[str, str] = {}
+        # Health and diagnostics both need service status; share one probe per window
+        self._services_status_for_bucket = lru_cache(maxsize=1)(self._probe_services_status)
+
+        # Status fields that never change after startup, assembled once
+        self._static_health = {"version": app_settings.app_version}
+        self._static_system = {
+            "version": app_settings.app_version,
+            "debug": app_settings.debug,
+            "host": app_settings.host,
+            "port": app_settings.port,
+            "environment": os.getenv("ENVIRONMENT", "development")
+        }
+        self._static_config = {
+            "app_name": app_settings.app_name,
+            "version": app_settings.app_version,
+            "debug": app_settings.debug,
+            "cors_origins": app_settings.cors_origins,
+            "data_directory": str(app_settings.data_dir),
+            "log_level": app_settings.log_level,
+            "cache_enabled": app_settings.cache_enabled,
+            "ai_providers_configured": self._provider_count
+        }
+
+        # Data status for the data service revision it was built from
+        self._last_data_revision: Optional[int] = None
+        self._last_data_status: Optional[Dict[str, Any]] = None
+
+        self._data_dir_exists = False
+        self._data_dir_checked_at: Optional[float] = None
+
+        # psutil can't appear at runtime, so pick the implementation once
+        self._get_system_info = (
+            self._get_system_info_psutil if PSUTIL_AVAILABLE else self._get_system_info_unavailable
+        )
+
+        # cpu_percent(interval=None) reports usage since the previous call,
+        # so take a throwaway first sample to start the measurement window
+        self._cpu_percent: Optional[float] = None
+        self._cpu_sampled_at = 0.0
+        if PSUTIL_AVAILABLE:
+            psutil.cpu_percent(interval=None)
+            self._cpu_sampled_at = time.monotonic()
+
+    def _cached(self, key: str, ttl: float, compute: Callable[[], Any]) -> Any:
+        """Return the stored value for key if younger than ttl, else recompute it"""
+        entry = self._fresh_entry(key, ttl)
+        if entry is not None:
+            return entry[1]
+
+        # Concurrent callers for the same key wait here and reuse the first caller's result
+        with self._cache_locks.setdefault(key, threading.Lock()):
+            entry = self._fresh_entry(key, ttl)
+            if entry is not None:
+                return entry[1]
+
+            value = compute()
+            self._cache[key] = (time.monotonic(), value)
+            return value
+
+    def _fresh_entry(self, key: str, ttl: float) -> Optional[Tuple[float, Any]]:
+        """Get the (computed_at, value) entry for key if younger than ttl, else None"""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry
+        return None
+
+    def _snapshot(self) -> Optional[Dict[str, Any]]:
+        """Get the latest background snapshot, or None if there is no fresh one"""
+        snapshot = self._last_snapshot
+        if snapshot is None or time.monotonic() - snapshot[0] > 2 * REFRESH_INTERVAL:
+            return None
+        return snapshot[1]
+
+    def _take_snapshot(self) -> Dict[str, Any]:
+        """Compute everything the snapshot serves, stamped with one shared time"""
+        now = time.time()
+        return {
+            "health": self._compute_health_status(now),
+            "diagnostics": self._compute_diagnostics(now)
+        }
+
+    async def run_refresh_loop(self):
+        """Keep the snapshot fresh until cancelled; started from the app lifespan"""
+        while True:
+            try:
+                snapshot = await asyncio.to_thread(self._take_snapshot)
+                self._last_snapshot = (time.monotonic(), snapshot)
+            except Exception as e:
+                logger.warning("Health snapshot refresh failed: %s", e)
+            await asyncio.sleep(REFRESH_INTERVAL)
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get comprehensive health status"""
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            return snapshot["health"]
+        return self._cached("health", HEALTH_TTL, self._compute_health_status)
+
+    async def get_health_status_async(self) -> Dict[str, Any]:
+        """Get comprehensive health status without blocking the event loop"""
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            return snapshot["health"]
+        # A miss may wait on the service probes, so keep it off the loop
+        return await asyncio.to_thread(self.get_health_status)
+
+    def shutdown(self):
+        """Release the probe threads; called from the app lifespan teardown"""
+        executor, self._probe_executor = self._probe_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_system_status(self) -> Dict[str, Any]:
+        """Get basic system status"""
+        return self._cached("system", SYSTEM_TTL, self._compute_system_status)
+
+    def get_config_status(self) -> Dict[str, Any]:
+        """Get configuration status (without sensitive data)"""
+        return self._cached("config", CONFIG_TTL, self._compute_config_status)
+
+    async def get_system_status_async(self) -> Dict[str, Any]:
+        """Get basic system status without blocking the event loop"""
+        entry = self._fresh_entry("system", SYSTEM_TTL)
+        if entry is not None:
+            return entry[1]
+        # A miss samples the system (and may wait on another caller), so keep it off the loop
+        return await asyncio.to_thread(self.get_system_status)
+
+    async def get_config_status_async(self) -> Dict[str, Any]:
+        """Get configuration status without blocking the event loop"""
+        entry = self._fresh_entry("config", CONFIG_TTL)
+        if entry is not None:
+            return entry[1]
+        return await asyncio.to_thread(self.get_config_status)
+
+    def _compute_health_status(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Build the comprehensive health status, stamped with now (default: current time)"""
+        if now is None:
+            now = time.time()
+
         try:
             return {
                 "status": "healthy",
-                "timestamp": time.time(),
-                "version": app_settings.app_version,
+                "timestamp": now,
+                **self._static_health,
                 "uptime": self._get_uptime(),
                 "system": self._get_system_info(),
                 "services": self._get_services_status(),
@@ -43,93 +223,106 @@ class HealthService:
             logger.error(f"Error getting health status: {str(e)}")
             return {
                 "status": "unhealthy",
-                "timestamp": time.time(),
+                "timestamp": now,
                 "error": str(e)
             }
 
-    def get_system_status(self) -> Dict[str, Any]:
-        """Get basic system status"""
+    def _compute_system_status(self) -> Dict[str, Any]:
+        """Build the basic system status"""
         try:
-            return {
-                "version": app_settings.app_version,
-                "debug": app_settings.debug,
-                "host": app_settings.host,
-                "port": app_settings.port,
-                "uptime": self._get_uptime(),
-                "environment": os.getenv("ENVIRONMENT", "development")
-            }
+            return {**self._static_system, "uptime": self._get_uptime()}
         except Exception as e:
             logger.error(f"Error getting system status: {str(e)}")
             return {"error": str(e)}
 
-    def get_config_status(self) -> Dict[str, Any]:
-        """Get configuration status (without sensitive data)"""
-        try:
-            return {
-                "app_name": app_settings.app_name,
-                "version": app_settings.app_version,
-                "debug": app_settings.debug,
-                "cors_origins": app_settings.cors_origins,
-                "data_directory": str(app_settings.data_dir),
-                "log_level": app_settings.log_level,
-                "cache_enabled": app_settings.cache_enabled,
-                "ai_providers_configured": self._count_configured_providers()
-            }
-        except Exception as e:
-            logger.error(f"Error getting config status: {str(e)}")
-            return {"error": str(e)}
+    def _compute_config_status(self) -> Dict[str, Any]:
+        """Build the configuration status (without sensitive data)"""
+        # Every field is fixed at startup, so the template is the answer; it is
+        # shared, and callers only serialize it
+        return self._static_config
 
     def _get_uptime(self) -> float:
-        """Get system uptime in seconds"""
-        return time.time() - self.start_time
+        """Get application uptime in seconds"""
+        return time.monotonic() - APP_START
 
-    def _get_system_info(self) -> Dict[str, Any]:
-        """Get basic system information"""
-        if not PSUTIL_AVAILABLE:
-            return {
-                "cpu_percent": "unavailable",
-                "memory": "unavailable",
-                "disk": "unavailable",
-                "note": "Install psutil for detailed system monitoring"
-            }
+    def _get_system_info_unavailable(self) -> Dict[str, Any]:
+        """Get the placeholder system information used without psutil"""
+        return {
+            "cpu_percent": "unavailable",
+            "memory": "unavailable",
+            "disk": "unavailable",
+            "note": "Install psutil for detailed system monitoring"
+        }
 
+    def _get_system_info_psutil(self) -> Dict[str, Any]:
+        """Get basic system information from psutil"""
         try:
+            # One snapshot each; every field read below comes from the same sample
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
             return {
-                "cpu_percent": psutil.cpu_percent(interval=1),
+                "cpu_percent": self._get_cpu_percent(),
                 "memory": {
-                    "total": psutil.virtual_memory().total,
-                    "available": psutil.virtual_memory().available,
-                    "percent": psutil.virtual_memory().percent
+                    "total": memory.total,
+                    "available": memory.available,
+                    "percent": memory.percent
                 },
                 "disk": {
-                    "total": psutil.disk_usage('/').total,
-                    "free": psutil.disk_usage('/').free,
-                    "percent": psutil.disk_usage('/').percent
+                    "total": disk.total,
+                    "free": disk.free,
+                    "percent": disk.percent
                 }
             }
         except Exception as e:
             logger.warning(f"Could not get system info: {str(e)}")
             return {"error": "System info unavailable"}
 
+    def _get_cpu_percent(self) -> float:
+        """Get CPU usage without blocking, resampling at most every CPU_SAMPLE_INTERVAL"""
+        now = time.monotonic()
+        if self._cpu_percent is None or now - self._cpu_sampled_at >= CPU_SAMPLE_INTERVAL:
+            self._cpu_percent = psutil.cpu_percent(interval=None)
+            self._cpu_sampled_at = now
+        return self._cpu_percent
+
+    def _probe_data_service(self) -> str:
+        """Check the data service"""
+        data_stats = data_service.get_data_stats()
+        return "operational" if data_stats else "error"
+
+    def _probe_ai_service(self) -> str:
+        """Check the AI service"""
+        return ai_service.get_ai_status().status
+
     def _get_services_status(self) -> Dict[str, str]:
-        """Get status of various services"""
+        """Get status of various services, probing at most once per SERVICES_STATUS_TTL window"""
+        return self._services_status_for_bucket(int(time.monotonic() // SERVICES_STATUS_TTL))
+
+    def _probe_services_status(self, _bucket: int) -> Dict[str, str]:
+        """Probe every service; _bucket only keys the lru_cache wrapper"""
         services = {}
 
-        try:
-            # Check data service
-            data_stats = data_service.get_data_stats()
-            services["data_service"] = "operational" if data_stats else "error"
-        except Exception as e:
-            logger.warning(f"Data service check failed: {str(e)}")
-            services["data_service"] = "error"
+        if self._probe_executor is None:
+            self._probe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-probe")
 
-        try:
-            # Check AI service
-            ai_status = ai_service.get_ai_status()
-            services["ai_service"] = ai_status.status
-        except Exception as e:
-            logger.warning(f"AI service check failed: {str(e)}")
-            services["ai_service"] = "error"
+        # The probes are independent, so run them side by side and wait at most
+        # PROBE_TIMEOUT for both together; a probe still running after that
+        # reports its last known status instead
+        probes = (
+            ("data_service", "Data service", self._probe_executor.submit(self._probe_data_service)),
+            ("ai_service", "AI service", self._probe_executor.submit(self._probe_ai_service)),
+        )
+        wait_futures([future for _, _, future in probes], timeout=PROBE_TIMEOUT)
+        for key, label, future in probes:
+            if not future.done():
+                logger.warning("%s check timed out after %ss", label, PROBE_TIMEOUT)
+                services[key] = self._last_probe_status.get(key, "error")
+                continue
+            try:
+                services[key] = self._last_probe_status[key] = future.result()
+            except Exception as e:
+                logger.warning("%s check failed: %s", label, e)
+                services[key] = "error"
 
         # Check database (placeholder)
         services["database"] = "not_configured"  # Since we don't have a real DB
@@ -140,42 +333,62 @@ class HealthService:
         return services
 
     def _get_data_status(self) -> Dict[str, Any]:
-        """Get data loading status"""
+        """Get data loading status, reusing the last one while the loaded data is unchanged
+
+        The returned dict is shared between calls and must not be mutated.
+        """
+        revision = data_service.stats_revision
+        if revision == self._last_data_revision:
+            return self._last_data_status
+
         try:
             stats = data_service.get_data_stats()
-            return {
+            status = {
                 "data_directory": stats.get("data_directory"),
                 "cached_files": stats.get("cached_files", []),
                 "projects_count": stats.get("projects_count", 0),
                 "experience_count": stats.get("experience_count", 0),
                 "certificates_count": stats.get("certificates_count", 0)
             }
+            # Keyed on the revision seen before the stats call, so loads it
+            # triggers (or that race with it) force one more refresh
+            self._last_data_revision = revision
+            self._last_data_status = status
+            return status
         except Exception as e:
             logger.warning(f"Could not get data status: {str(e)}")
             return {"error": "Data status unavailable"}
 
+    def _check_data_dir(self) -> bool:
+        """Check the data directory exists, re-stat-ing at most every DATA_DIR_CHECK_TTL"""
+        now = time.monotonic()
+        if self._data_dir_checked_at is None or now - self._data_dir_checked_at > DATA_DIR_CHECK_TTL:
+            self._data_dir_exists = app_settings.data_dir.exists()
+            self._data_dir_checked_at = now
+        return self._data_dir_exists
+
     def _count_configured_providers(self) -> int:
         """Count configured AI providers"""
-        count = 0
-        if app_settings.groq_api_key:
-            count += 1
-        if app_settings.openai_api_key:
-            count += 1
-        if app_settings.anthropic_api_key:
-            count += 1
-        return count
+        return self._provider_count
 
     def perform_diagnostics(self) -> Dict[str, Any]:
         """Perform comprehensive system diagnostics"""
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            return snapshot["diagnostics"]
+        return self._compute_diagnostics()
+
+    def _compute_diagnostics(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Run every diagnostic check, stamped with now (default: current time)"""
         diagnostics = {
-            "timestamp": time.time(),
+            "timestamp": time.time() if now is None else now,
             "checks": []
         }
 
         # Data directory check
         data_dir_check = {
             "name": "Data Directory",
-            "status": "pass" if app_settings.data_dir.exists() else "fail",
+            "status": "pass" if self._check_data_dir() else "fail",
             "details": f"Directory: {app_settings.data_dir}"
         }
         diagnostics["checks"].append(data_dir_check)
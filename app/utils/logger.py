@@ -18,13 +18,37 @@ Usage:
     logger.critical("Critical message")
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
+import weakref
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+# Default log location, anchored to the project root rather than the working directory
+_LOG_DIR = Path(__file__).resolve().parents[2] / "logs"
+
+# Listeners draining the per-logger queues, stopped (and flushed) at exit
+_listeners = []
 
 class CLogger(logging.Formatter):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    # Console color for each level; other levels are printed uncolored
+    LEVEL_COLORS = {
+        logging.DEBUG: "cyan",
+        logging.INFO: "green",
+        logging.WARNING: "yellow",
+        logging.ERROR: "red",
+        logging.CRITICAL: "magenta",
+    }
+
+    def __init__(self, fmt: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                 datefmt: str = "%Y-%m-%d %H:%M:%S", *args, **kwargs):
+        super().__init__(fmt, datefmt, *args, **kwargs)
         self.colors = {
             "red": "\033[31m",
             "green": "\033[32m",
@@ -38,40 +62,109 @@ class CLogger(logging.Formatter):
             "reset": "\033[0m",
         }
 
+        # One ready-made formatter per level number, so format() is a dict
+        # lookup and never mutates shared state between threads
+        self._plain_formatter = logging.Formatter(fmt, datefmt)
+        self._level_formatters = {
+            level: logging.Formatter(self.colors[color] + fmt + self.colors["reset"], datefmt)
+            for level, color in self.LEVEL_COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        # Create the basic log message
-        log_fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-        # Add color based on log level
-        if record.levelname == "DEBUG":
-            log_fmt = self.colors["cyan"] + log_fmt + self.colors["reset"]
-        elif record.levelname == "INFO":
-            log_fmt = self.colors["green"] + log_fmt + self.colors["reset"]
-        elif record.levelname == "WARNING":
-            log_fmt = self.colors["yellow"] + log_fmt + self.colors["reset"]
-        elif record.levelname == "ERROR":
-            log_fmt = self.colors["red"] + log_fmt + self.colors["reset"]
-        elif record.levelname == "CRITICAL":
-            log_fmt = self.colors["magenta"] + log_fmt + self.colors["reset"]
-
-        # Format the message using the standard formatter
-        formatter = logging.Formatter(log_fmt, "%Y-%m-%d %H:%M:%S")
+        formatter = self._level_formatters.get(record.levelno, self._plain_formatter)
         return formatter.format(record)
 
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes.
+
+    The file is opened with a write buffer, and the per-record flush that
+    StreamHandler.emit asks for only reaches the disk once every
+    FLUSH_INTERVAL seconds. One shared background thread flushes every
+    open handler after a burst, and closing the file flushes it too.
+
+    There is no size-based rotation: it would stat and seek the file on
+    every record (defeating the buffer) and is unsafe with several worker
+    processes appending to the same file. Rotate with an external tool
+    such as logrotate (copytruncate) instead.
+    """
+
+    FLUSH_INTERVAL = 0.5
+
+    def __init__(self, filename, *args, buffer_size: int = 8192, **kwargs):
+        self.buffer_size = buffer_size
+        self._last_flush = time.monotonic()
+        super().__init__(filename, *args, **kwargs)
+        _register_buffered_handler(self)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self._flush_now()
+
+    def _flush_now(self):
+        self.acquire()
+        try:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def close(self):
+        _unregister_buffered_handler(self)
+        super().close()
+
+
+# Open buffered handlers, flushed together by a single daemon thread
+_buffered_handlers = weakref.WeakSet()
+_buffered_handlers_lock = threading.Lock()
+_flusher_thread = None
+
+
+def _register_buffered_handler(handler: BufferedFileHandler):
+    global _flusher_thread
+    with _buffered_handlers_lock:
+        _buffered_handlers.add(handler)
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(target=_flush_buffered_handlers, name="log-flush", daemon=True)
+            _flusher_thread.start()
+
+
+def _unregister_buffered_handler(handler: BufferedFileHandler):
+    with _buffered_handlers_lock:
+        _buffered_handlers.discard(handler)
+
+
+def _flush_buffered_handlers():
+    while True:
+        time.sleep(BufferedFileHandler.FLUSH_INTERVAL)
+        with _buffered_handlers_lock:
+            handlers = list(_buffered_handlers)
+        for handler in handlers:
+            handler._flush_now()
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str = None,
-               log_dir: str = "logs",
+               log_dir: str = str(_LOG_DIR),
                complete_log: str = "complete.log",
                session_prefix: str = "session") -> logging.Logger:
-    """Create a logger with file handlers (complete + session) and console output."""
+    """Create a logger with file handlers (complete + session) and console output.
+
+    Memoized per argument set, so repeated calls return the same logger
+    without touching the log directory again.
+    """
+    # One clock read serves both the default name and the session file name
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     if name is None:
-        name = datetime.now().strftime('%Y%m%d_%H%M%S')  # Default to date-time string
+        name = timestamp  # Default to date-time string
     
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-
+    os.makedirs(log_dir, exist_ok=True)
 
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
@@ -89,25 +182,40 @@ def get_logger(name: str = None,
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     # Complete log file handler
-    complete_handler = logging.FileHandler(os.path.join(log_dir, complete_log))
+    # delay=True: files are only opened by the listener thread on first write
+    complete_handler = BufferedFileHandler(os.path.join(log_dir, complete_log), delay=True)
     complete_handler.setLevel(logging.DEBUG)
     complete_handler.setFormatter(file_formatter)
-    logger.addHandler(complete_handler)
 
-    # Session log file handler
+    # Session log file handler, one file per process so workers started in
+    # the same second don't share it
     session_file = os.path.join(
         log_dir,
-        f"{session_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        f"{session_prefix}_{timestamp}_{os.getpid()}.log"
     )
-    session_handler = logging.FileHandler(session_file)
+    session_handler = BufferedFileHandler(session_file, delay=True)
     session_handler.setLevel(logging.DEBUG)
     session_handler.setFormatter(file_formatter)
-    logger.addHandler(session_handler)
+
+    # Logging calls only enqueue the record; a background listener thread
+    # does the formatting and the console/file writes
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, console_handler, complete_handler, session_handler,
+                             respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
 
     return logger
 
 
+@atexit.register
+def stop_listeners():
+    """Flush queued records and stop all logging listener threads"""
+    while _listeners:
+        _listeners.pop().stop()
+
+
 logger = get_logger()
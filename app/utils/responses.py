@@ -0,0 +1,16 @@
+"""
+Response helpers shared by the route modules.
+"""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+
+def success_response(message: str, data: Any) -> ORJSONResponse:
+    """Wrap already JSON-safe data in the standard success envelope"""
+    return ORJSONResponse({
+        "success": True,
+        "message": message,
+        "data": data
+    })
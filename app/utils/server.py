@@ -0,0 +1,24 @@
+"""
+Uvicorn launch helpers shared by the entrypoints.
+"""
+
+from typing import Tuple
+
+
+def uvicorn_backends() -> Tuple[str, str]:
+    """Pick the fastest installed event loop and HTTP parser for uvicorn"""
+    # Prefer the C-backed event loop and HTTP parser, falling back to the
+    # pure-Python defaults where they are not installed (e.g. Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
+    return loop, http
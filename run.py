@@ -0,0 +1,27 @@
+"""
+Production entrypoint: serves the API across multiple worker processes.
+
+Usage: python run.py
+"""
+
+import os
+
+import uvicorn
+
+from app.config.settings import get_app_settings
+from app.utils.server import uvicorn_backends
+
+
+if __name__ == "__main__":
+    app_settings = get_app_settings()
+    loop, http = uvicorn_backends()
+
+    uvicorn.run(
+        "app.main:app",
+        host=app_settings.host,
+        port=app_settings.port,
+        workers=app_settings.workers or os.cpu_count() or 1,
+        loop=loop,
+        http=http,
+        log_level="info"
+    )
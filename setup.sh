@@ -6,16 +6,16 @@ echo "🚀 Setting up Resume Backend Manual..."
 
 # Check if Python is available
 if ! command -v python &> /dev/null; then
-    echo "❌ Python is not installed. Please install Python 3.8+ first."
+    echo "❌ Python is not installed. Please install Python 3.11+ first."
     exit 1
 fi
 
 # Check Python version
 PYTHON_VERSION=$(python -c 'import sys; print(".".join(map(str, sys.version_info[:2])))')
-if python -c "import sys; sys.exit(0 if sys.version_info >= (3, 8) else 1)"; then
+if python -c "import sys; sys.exit(0 if sys.version_info >= (3, 11) else 1)"; then
     echo "✅ Python $PYTHON_VERSION detected"
 else
-    echo "❌ Python 3.8+ is required. Current version: $PYTHON_VERSION"
+    echo "❌ Python 3.11+ is required. Current version: $PYTHON_VERSION"
     exit 1
 fi
 
@@ -2,9 +2,13 @@ import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    """Share one client, and one run of the app lifespan, across the module"""
+    with TestClient(app) as test_client:
+        yield test_client
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test the root endpoint"""
     response = client.get("/")
     assert response.status_code == 200
@@ -13,7 +17,7 @@ def test_root_endpoint():
     assert "version" in data
     assert "status" in data
 
-def test_health_endpoint():
+def test_health_endpoint(client):
     """Test the health check endpoint"""
     response = client.get("/api/v1/health")
     assert response.status_code == 200
@@ -21,7 +25,14 @@ def test_health_endpoint():
     assert data["status"] == "healthy"
     assert "version" in data
 
-def test_status_endpoint():
+def test_health_endpoint_cached(client):
+    """Test repeated health checks are served from the short-lived cache"""
+    first = client.get("/api/v1/health")
+    second = client.get("/api/v1/health")
+    assert first.headers["cache-control"] == "max-age=5"
+    assert first.json()["timestamp"] == second.json()["timestamp"]
+
+def test_status_endpoint(client):
     """Test the status endpoint"""
     response = client.get("/api/v1/status")
     assert response.status_code == 200
@@ -29,7 +40,7 @@ def test_status_endpoint():
     assert data["success"] == True
     assert "data" in data
 
-def test_config_endpoint():
+def test_config_endpoint(client):
     """Test the config endpoint"""
     response = client.get("/api/v1/config")
     assert response.status_code == 200
@@ -40,7 +51,7 @@ def test_config_endpoint():
 # Note: Data endpoints would require actual data files to test properly
 # These tests serve as a template for when data files are available
 
-def test_ai_status_endpoint():
+def test_ai_status_endpoint(client):
     """Test the AI status endpoint"""
     response = client.get("/api/v1/ai/status")
     assert response.status_code == 200
@@ -48,3 +59,95 @@ def test_ai_status_endpoint():
     assert "status" in data
     assert "components" in data
     assert "providers" in data
+
+def test_profile_endpoint(client):
+    """Test the profile endpoint returns the cached response envelope"""
+    first = client.get("/api/v1/data/profile")
+    second = client.get("/api/v1/data/profile")
+    assert first.status_code == 200
+    assert first.content == second.content
+    data = first.json()
+    assert data["success"] == True
+    assert "data" in data
+
+def test_profile_conditional_request(client):
+    """Test the profile endpoint honours If-None-Match"""
+    first = client.get("/api/v1/data/profile")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "public, max-age=60"
+
+    response = client.get("/api/v1/data/profile", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+def test_profile_conditional_request_weak_etag(client):
+    """Test weak validators and the wildcard also match the profile ETag"""
+    etag = client.get("/api/v1/data/profile").headers["etag"]
+
+    response = client.get("/api/v1/data/profile", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+
+    response = client.get("/api/v1/data/profile", headers={"If-None-Match": "*"})
+    assert response.status_code == 304
+
+    response = client.get("/api/v1/data/profile", headers={"If-None-Match": 'W/"other"'})
+    assert response.status_code == 200
+
+def test_project_by_id_endpoint(client):
+    """Test fetching a single project by id"""
+    projects = client.get("/api/v1/data/projects").json()["data"]
+    project_id = projects[0]["id"]
+
+    response = client.get(f"/api/v1/data/projects/{project_id}")
+    assert response.status_code == 200
+    assert response.json()["data"]["id"] == project_id
+
+    response = client.get("/api/v1/data/projects/does-not-exist")
+    assert response.status_code == 404
+
+def test_projects_filtering(client):
+    """Test category and featured filters on the projects endpoint"""
+    projects = client.get("/api/v1/data/projects").json()["data"]
+    category = projects[0]["category"]
+
+    response = client.get("/api/v1/data/projects", params={"category": category.upper()})
+    assert response.status_code == 200
+    filtered = response.json()["data"]
+    assert filtered == [p for p in projects if p["category"].lower() == category.lower()]
+
+    response = client.get("/api/v1/data/projects", params={"featured": "true", "limit": 2})
+    featured = response.json()["data"]
+    assert featured == [p for p in projects if p["featured"]][:2]
+
+def test_ai_classify_endpoint(client):
+    """Test message classification"""
+    response = client.post("/api/v1/ai/classify", json={"message": "What Python projects have you built?"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["type"] == "question"
+    assert data["intent"] == "project_inquiry"
+    assert data["entities"] == {"technologies": ["python"]}
+
+def test_ai_chat_endpoint(client):
+    """Test repeated chat prompts get the same reply"""
+    payload = {"message": "Tell me about your projects"}
+    first = client.post("/api/v1/ai/chat", json=payload)
+    second = client.post("/api/v1/ai/chat", json=payload)
+    assert first.status_code == 200
+    assert first.json() == second.json()
+    assert "projects" in first.json()["content"]
+
+def test_projects_with_malformed_entries(tmp_path, monkeypatch):
+    """Test projects without a category, or that aren't objects, don't break loading"""
+    from app.services.data_service import DataService
+
+    (tmp_path / "projects.json").write_text(
+        '[{"id": "a", "category": null, "featured": true}, "junk", {"id": "b", "category": "Web"}]'
+    )
+    service = DataService()
+    monkeypatch.setattr(service, "data_dir", tmp_path)
+
+    assert service.get_project_by_id("a")["id"] == "a"
+    assert service.get_projects_data(category="web") == [{"id": "b", "category": "Web"}]
+    assert service.get_projects_data(featured=True) == [{"id": "a", "category": None, "featured": True}]